@@ -4,18 +4,39 @@ replies.
 """
 from __future__ import annotations
 from typing import Union, Optional, Sequence
-import doctest
-import base64
+import math
+import os
 import secrets
+import struct
 import hashlib
 import hmac
 from lagrange import lagrange
 import bcl
 import pailliers
 
+try:
+    import pybase64 as base64 # SIMD-accelerated drop-in replacement (if available).
+    _b64encode_as_string = base64.b64encode_as_string # pragma: no cover
+except ImportError: # pragma: no cover
+    import base64
+    def _b64encode_as_string(b: bytes) -> str:
+        """Encode a bytes-like object as a Base64 string."""
+        return base64.b64encode(b).decode('ascii')
+
+try:
+    from gmpy2 import powmod as _powmod # GMP-backed modular exponentiation (if available).
+except ImportError: # pragma: no cover
+    _powmod = pow
+
 _PAILLIER_KEY_LENGTH = 2048
 """Length in bits of Paillier keys."""
 
+_PAILLIER_CRT_SEARCH_LIMIT = 1024
+"""
+Maximum multiplier of the Carmichael function value considered when recovering
+the prime factors of a Paillier modulus.
+"""
+
 _PLAINTEXT_SIGNED_INTEGER_MIN = -2147483648
 """Minimum plaintext 32-bit signed integer value that can be encrypted."""
 
@@ -70,7 +91,7 @@ def _random_bytes(length: int, seed: Optional[bytes] = None, salt: Optional[byte
     if seed is not None:
         return _hkdf(length, seed, b'' if salt is None else salt)
 
-    return secrets.token_bytes(length)
+    return os.urandom(length)
 
 def _random_int(
         minimum: int,
@@ -193,11 +214,167 @@ def _shamirs_add(shares_a, shares_b, prime=_SECRET_SHARED_SIGNED_INTEGER_MODULUS
         if i == j
     ]
 
+def _paillier_encrypt(public_key: pailliers.public, plaintext: int) -> int:
+    """
+    Encrypt an integer plaintext using the supplied Paillier public key. If
+    the key uses the generator ``g = n + 1`` (as do all keys created by
+    :obj:`SecretKey.generate`), the modular exponentiation ``g ** m`` is
+    replaced by the equivalent ``1 + m * n``. This saves a full-width modular
+    exponentiation only for negative plaintexts (which become exponents as
+    large as ``n`` once reduced modulo ``n``); for non-negative 32-bit
+    plaintexts, the exponent is small and the cost of encryption is dominated
+    by the computation of ``r ** n`` in either case.
+
+    >>> sk = pailliers.secret(128)
+    >>> c = _paillier_encrypt(pailliers.public(sk), 123)
+    >>> pailliers.decrypt(sk, pailliers.cipher(c))
+    123
+    >>> (lam, _, n, _) = sk
+    >>> sk = tuple.__new__(pailliers.secret, (lam, pow(lam, -1, n), n, n + 1))
+    >>> c = _paillier_encrypt(pailliers.public(sk), 123)
+    >>> pailliers.decrypt(sk, pailliers.cipher(c))
+    123
+
+    Only public keys can be used to encrypt.
+
+    >>> _paillier_encrypt(sk, 123)
+    Traceback (most recent call last):
+      ...
+    TypeError: can only encrypt using a public key
+    """
+    if not isinstance(public_key, pailliers.public):
+        raise TypeError('can only encrypt using a public key')
+
+    (n, g) = public_key
+    modulus = n * n
+    plaintext %= n
+
+    r = 0
+    while r == 0 or math.gcd(r, n) != 1:
+        r = secrets.randbelow(n)
+
+    g_to_m = (
+        (1 + plaintext * n) % modulus
+        if g == n + 1 else
+        _powmod(g, plaintext, modulus)
+    )
+    return int((g_to_m * _powmod(r, n, modulus)) % modulus)
+
+def _paillier_crt(secret_key: pailliers.secret) -> Optional[tuple]:
+    """
+    Return the prime factors of the modulus of the supplied Paillier secret
+    key along with the constants needed to decrypt via the Chinese remainder
+    theorem (or ``None`` if the factors cannot be recovered). The factors are
+    recovered from the Carmichael function value ``lam`` using the fact that
+    ``(p - 1) * (q - 1)`` is a small multiple of ``lam`` (namely, the greatest
+    common divisor of ``p - 1`` and ``q - 1``). Only multipliers up to
+    :obj:`_PAILLIER_CRT_SEARCH_LIMIT` are considered, so keys that have an
+    unusually large multiplier (or a malformed ``lam``) are not factored.
+
+    Nothing is memoized, so the recovered factors do not outlive the call that
+    uses them. For keys that use the generator ``g = n + 1`` (as do all keys
+    created by :obj:`SecretKey.generate`), the constants ``h_p`` and ``h_q``
+    have the closed forms ``(-q) ** -1 mod p`` and ``(-p) ** -1 mod q``, so
+    recovering them requires no modular exponentiations.
+
+    >>> sk = pailliers.secret(128)
+    >>> (p, q) = _paillier_crt(sk)[:2]
+    >>> p.bit_length() == q.bit_length() == 128
+    True
+    >>> (lam, _, n, _) = sk
+    >>> sk_alt = tuple.__new__(pailliers.secret, (lam, pow(lam, -1, n), n, n + 1))
+    >>> constants = _paillier_crt(sk_alt)
+    >>> constants[4] == pow((pow(n + 1, p - 1, p * p) - 1) // p, -1, p)
+    True
+    >>> constants[5] == pow((pow(n + 1, q - 1, q * q) - 1) // q, -1, q)
+    True
+    >>> _paillier_crt(tuple.__new__(pailliers.secret, (5, 1, 35, 36))) is None
+    True
+    >>> n = (2 ** 127 - 1) * (2 ** 521 - 1)
+    >>> _paillier_crt(tuple.__new__(pailliers.secret, (2, 1, n, n + 1))) is None
+    True
+    """
+    (lam, _, n, g) = secret_key
+    for k in range(1, min(n // lam, _PAILLIER_CRT_SEARCH_LIMIT) + 1):
+        total = n + 1 - k * lam # Candidate value for ``p + q``.
+        discriminant = total * total - 4 * n
+        if discriminant >= 0 and math.isqrt(discriminant) ** 2 == discriminant:
+            root = math.isqrt(discriminant)
+            (p, q) = ((total + root) // 2, (total - root) // 2)
+            (p_squared, q_squared) = (p * p, q * q)
+            (h_p, h_q) = (
+                (pow(-q, -1, p), pow(-p, -1, q))
+                if g == n + 1 else
+                (
+                    pow((int(_powmod(g, p - 1, p_squared)) - 1) // p, -1, p),
+                    pow((int(_powmod(g, q - 1, q_squared)) - 1) // q, -1, q)
+                )
+            )
+            return (p, q, p_squared, q_squared, h_p, h_q, pow(p, -1, q))
+
+    return None
+
+def _paillier_decrypt(secret_key: pailliers.secret, ciphertext: int) -> int:
+    """
+    Decrypt an integer ciphertext using the supplied Paillier secret key. The
+    two half-width modular exponentiations modulo ``p ** 2`` and ``q ** 2``
+    are combined via the Chinese remainder theorem (falling back to a single
+    full-width modular exponentiation if the factors are not available).
+
+    >>> sk = pailliers.secret(128)
+    >>> _paillier_decrypt(sk, _paillier_encrypt(pailliers.public(sk), 123))
+    123
+    >>> sk = tuple.__new__(pailliers.secret, (5, 1, 35, 36))
+    >>> _paillier_decrypt(sk, 1)
+    0
+
+    Keys that cannot be factored efficiently (such as a key with a degenerate
+    ``lam``) are also handled by the fallback.
+
+    >>> n = (2 ** 127 - 1) * (2 ** 521 - 1)
+    >>> isinstance(_paillier_decrypt(tuple.__new__(pailliers.secret, (2, 1, n, n + 1)), 1), int)
+    True
+
+    Only secret keys can be used to decrypt.
+
+    >>> _paillier_decrypt(pailliers.public(sk), 123)
+    Traceback (most recent call last):
+      ...
+    TypeError: can only decrypt using a secret key
+    """
+    if not isinstance(secret_key, pailliers.secret):
+        raise TypeError('can only decrypt using a secret key')
+
+    constants = _paillier_crt(secret_key)
+    if constants is None:
+        return int(pailliers.decrypt(secret_key, pailliers.cipher(ciphertext)))
+
+    (p, q, p_squared, q_squared, h_p, h_q, p_inverse) = constants
+    m_p = (((int(_powmod(ciphertext, p - 1, p_squared)) - 1) // p) * h_p) % p
+    m_q = (((int(_powmod(ciphertext, q - 1, q_squared)) - 1) // q) * h_q) % q
+    return m_p + p * (((m_q - m_p) * p_inverse) % q)
+
+def _inverse_masks(masks: Sequence[int]) -> tuple:
+    """
+    Return the multiplicative inverses of the supplied secret sharing masks.
+
+    >>> _inverse_masks((1, 2))
+    (1, 2147483656)
+    """
+    return tuple(
+        pow(
+            mask,
+            _SECRET_SHARED_SIGNED_INTEGER_MODULUS - 2,
+            _SECRET_SHARED_SIGNED_INTEGER_MODULUS
+        )
+        for mask in masks
+    )
+
 def _pack(b: bytes) -> str:
     """
     Encode a bytes-like object as a Base64 string (for compatibility with JSON).
     """
-    return base64.b64encode(b).decode('ascii')
+    return _b64encode_as_string(b)
 
 def _unpack(s: str) -> bytes:
     """
@@ -205,6 +382,23 @@ def _unpack(s: str) -> bytes:
     """
     return base64.b64decode(s)
 
+def _xor_bytes(*buffers: bytes) -> bytes:
+    """
+    Return the bitwise XOR of one or more bytes-like objects of the same
+    length (computed over machine words by treating each as an integer and
+    converting only the final result back into bytes).
+
+    >>> _xor_bytes(bytes([1, 2, 3]), bytes([3, 2, 1])).hex()
+    '020002'
+    >>> _xor_bytes(bytes([1, 2, 3]), bytes([3, 2, 1]), bytes([2, 0, 2])).hex()
+    '000000'
+    """
+    integer = 0
+    for buffer in buffers:
+        integer ^= int.from_bytes(buffer, 'little')
+
+    return integer.to_bytes(len(buffers[0]), 'little')
+
 def _encode(value: Union[int, str, bytes]) -> bytes:
     """
     Encode an integer, string, or binary plaintext as a binary value.
@@ -226,16 +420,13 @@ def _encode(value: Union[int, str, bytes]) -> bytes:
     ValueError: cannot encode value
     """
     if isinstance(value, int):
-        return (
-            bytes([0]) +
-            (value - _PLAINTEXT_SIGNED_INTEGER_MIN).to_bytes(8, 'little')
-        )
+        return struct.pack('<BQ', 0, value - _PLAINTEXT_SIGNED_INTEGER_MIN)
 
     if isinstance(value, str):
-        return bytes([1]) + value.encode('UTF-8')
+        return b'\x01' + value.encode('UTF-8')
 
     if isinstance(value, bytes):
-        return bytes([2]) + value
+        return b'\x02' + value
 
     raise ValueError('cannot encode value')
 
@@ -405,7 +596,14 @@ for single-node clusters
                         'seed-based derivation of summation-compatible keys ' +
                         'is not supported for single-node clusters'
                     )
-                secret_key['material'] = pailliers.secret(SecretKey._paillier_key_length)
+                # The generator is replaced with ``n + 1`` (with the inverse of the
+                # Carmichael function value as the matching decryption factor) so
+                # that encryption can avoid one modular exponentiation.
+                (lam, _, n, _) = pailliers.secret(SecretKey._paillier_key_length)
+                secret_key['material'] = tuple.__new__(
+                    pailliers.secret,
+                    (lam, pow(lam, -1, n), n, n + 1)
+                )
             else:
                 # Distinct multiplicative mask for each additive share.
                 secret_key['material'] = [
@@ -717,10 +915,13 @@ def encrypt(
         # Encode an integer for storage or matching.
         buffer = _encode(plaintext)
 
+    cluster_size = len(key['cluster']['nodes'])
+    operations = key['operations']
+
     # Encrypt a plaintext for storage and retrieval.
-    if key['operations'].get('store'):
+    if operations.get('store'):
         # For single-node clusters, the data is encrypted using a symmetric key.
-        if len(key['cluster']['nodes']) == 1:
+        if cluster_size == 1:
             return _pack(
                 bcl.symmetric.encrypt(key['material'], bcl.plain(buffer))
             )
@@ -732,59 +933,58 @@ def encrypt(
             if 'material' in key else
             (lambda s: s)
         )
-        shares = []
-        aggregate = bytes(len(buffer))
-        for _ in range(len(key['cluster']['nodes']) - 1):
-            mask = _random_bytes(len(buffer))
-            aggregate = bytes(a ^ b for (a, b) in zip(aggregate, mask))
-            shares.append(optional_enc(mask))
-        shares.append(optional_enc(
-            bytes(a ^ b for (a, b) in zip(aggregate, buffer))
-        ))
+        # All masks are drawn from a single buffer of random bytes.
+        length = len(buffer)
+        randomness = _random_bytes(length * (cluster_size - 1))
+        masks = [
+            randomness[i:i + length]
+            for i in range(0, len(randomness), length)
+        ]
+        shares = [optional_enc(mask) for mask in masks]
+        shares.append(optional_enc(_xor_bytes(buffer, *masks)))
         return list(map(_pack, shares))
 
     # Encrypt (i.e., hash) a plaintext for matching.
-    if key['operations'].get('match'):
+    if operations.get('match'):
         # The deterministic salted hash of the encoded plaintext is the ciphertext.
         ciphertext = _pack(_HASH(key['material'] + buffer).digest())
 
         # For multiple-node clusters, replicate the ciphertext for each node.
-        if len(key['cluster']['nodes']) > 1:
-            ciphertext = [ciphertext for _ in key['cluster']['nodes']]
+        if cluster_size > 1:
+            ciphertext = [ciphertext] * cluster_size
 
         return ciphertext
 
     # Encrypt an integer plaintext in a summation-compatible way.
-    if key['operations'].get('sum'):
+    if operations.get('sum'):
         # Non-integer cannot be encrypted for summation.
         if not isinstance(plaintext, int):
             raise TypeError('plaintext to encrypt for sum operation must be an integer')
 
         # For single-node clusters, the Paillier cryptosystem is used.
-        if len(key['cluster']['nodes']) == 1:
-            return hex(pailliers.encrypt(key['material'], plaintext))[2:] # No '0x'.
+        if cluster_size == 1:
+            return format(_paillier_encrypt(key['material'], plaintext), 'x') # No '0x'.
 
         # For multiple-node clusters and no threshold, additive secret sharing is used.
         if 'threshold' not in key:
             masks = [
                 key['material'][i] if 'material' in key else 1
-                for i in range(len(key['cluster']['nodes']))
+                for i in range(cluster_size)
             ]
             shares = []
             total = 0
-            quantity = len(key['cluster']['nodes'])
-            for i in range(quantity - 1):
+            for i in range(cluster_size - 1):
                 share_ =  _random_int(0, _SECRET_SHARED_SIGNED_INTEGER_MODULUS - 1)
                 shares.append(
                     (masks[i] * share_)
                     %
                     _SECRET_SHARED_SIGNED_INTEGER_MODULUS
                 )
-                total = (total + share_) % _SECRET_SHARED_SIGNED_INTEGER_MODULUS
+                total += share_ # Reduced only once (below).
 
             shares.append(
                 (
-                    masks[quantity - 1] *
+                    masks[cluster_size - 1] *
                     ((plaintext - total) % _SECRET_SHARED_SIGNED_INTEGER_MODULUS)
                 ) % _SECRET_SHARED_SIGNED_INTEGER_MODULUS
             )
@@ -793,10 +993,9 @@ def encrypt(
         # For multiple-node clusters and a threshold, Shamir's secret sharing is used.
         masks = [
             key['material'][i] if 'material' in key else 1
-            for i in range(len(key['cluster']['nodes']))
+            for i in range(cluster_size)
         ]
-        num_nodes = len(key['cluster']['nodes'])
-        shares = _shamirs_shares(plaintext, num_nodes, key['threshold'])
+        shares = _shamirs_shares(plaintext, cluster_size, key['threshold'])
         for (i, share) in enumerate(shares):
             share[1] = (masks[i] * share[1]) % _SECRET_SHARED_SIGNED_INTEGER_MODULUS
 
@@ -872,14 +1071,22 @@ def decrypt(
     Traceback (most recent call last):
       ...
     ValueError: cannot decrypt the supplied ciphertext using the supplied key
+    >>> ck = ClusterKey.generate({'nodes': [{}, {}]}, {'store': True})
+    >>> decrypt(ck, ['AAA=', 'AAAA'])
+    Traceback (most recent call last):
+      ...
+    ValueError: cannot decrypt the supplied ciphertext using the supplied key
     """
     error = ValueError(
         'cannot decrypt the supplied ciphertext using the supplied key'
     )
 
+    cluster_size = len(key['cluster']['nodes'])
+    operations = key['operations']
+
     # Confirm that the secret key and ciphertext have compatible cluster
     # specifications.
-    if len(key['cluster']['nodes']) == 1:
+    if cluster_size == 1:
         if not isinstance(ciphertext, str):
             raise ValueError(
               'secret key requires a valid ciphertext from a single-node cluster'
@@ -910,7 +1117,7 @@ def decrypt(
             len(ciphertext) < (
                 key['threshold']
                 if 'threshold' in key else
-                len(key['cluster']['nodes'])
+                cluster_size
             )
         ):
             raise ValueError(
@@ -918,9 +1125,9 @@ def decrypt(
             )
 
     # Decrypt a value that was encrypted for storage and retrieval.
-    if key['operations'].get('store'):
+    if operations.get('store'):
         # For single-node clusters, the plaintext is encrypted using a symmetric key.
-        if len(key['cluster']['nodes']) == 1:
+        if cluster_size == 1:
             try:
                 return _decode(
                     bcl.symmetric.decrypt(
@@ -943,38 +1150,32 @@ def decrypt(
             except Exception as exc:
                 raise error from exc
 
-        bytes_ = bytes(len(shares[0]))
-        for share_ in shares:
-            bytes_ = bytes(a ^ b for (a, b) in zip(bytes_, share_))
+        if any(len(share_) != len(shares[0]) for share_ in shares):
+            raise error
 
-        return _decode(bytes_)
+        return _decode(_xor_bytes(*shares))
 
     # Decrypt a value that was encrypted in a summation-compatible way.
-    if key['operations'].get('sum'):
+    if operations.get('sum'):
         # For single-node clusters, the Paillier cryptosystem is used.
-        if len(key['cluster']['nodes']) == 1:
-            return pailliers.decrypt(
-                key['material'],
-                pailliers.cipher(int(ciphertext, 16))
-            )
+        if cluster_size == 1:
+            return _paillier_decrypt(key['material'], int(ciphertext, 16))
+
+        # The inverses of the multiplicative masks are computed once for
+        # all of the shares.
+        inverse_masks = _inverse_masks(
+            key['material']
+            if 'material' in key else
+            (1,) * cluster_size
+        )
 
         # For multiple-node clusters and no threshold, additive secret sharing is used.
         if 'threshold' not in key:
-            inverse_masks = [
-                pow(
-                    key['material'][i] if 'material' in key else 1,
-                    _SECRET_SHARED_SIGNED_INTEGER_MODULUS - 2,
-                    _SECRET_SHARED_SIGNED_INTEGER_MODULUS
-                )
-                for i in range(len(key['cluster']['nodes']))
-            ]
             shares = ciphertext
             plaintext = 0
             for (i, share_) in enumerate(shares):
-                plaintext = (
-                    plaintext +
-                    ((inverse_masks[i] * share_) % _SECRET_SHARED_SIGNED_INTEGER_MODULUS)
-                ) % _SECRET_SHARED_SIGNED_INTEGER_MODULUS
+                plaintext += inverse_masks[i] * share_
+            plaintext %= _SECRET_SHARED_SIGNED_INTEGER_MODULUS
 
             # Field elements in the "upper half" of the field represent negative
             # integers.
@@ -984,14 +1185,6 @@ def decrypt(
             return plaintext
 
         # For multiple-node clusters and a threshold, Shamir's secret sharing is used.
-        inverse_masks = [
-            pow(
-                key['material'][i] if 'material' in key else 1,
-                _SECRET_SHARED_SIGNED_INTEGER_MODULUS - 2,
-                _SECRET_SHARED_SIGNED_INTEGER_MODULUS
-            )
-            for i in range(len(key['cluster']['nodes']))
-        ]
         shares = ciphertext
         for (i, share) in enumerate(shares):
             share[1] = (
@@ -1209,6 +1402,19 @@ def unify(
     >>> 123 == unify(sk, [123])
     True
 
+    Ignored keys are also omitted from any subdocument without ciphertexts that
+    :obj:`allot` shares (as the same object) across all of the document shares.
+
+    >>> shares = allot({
+    ...     'meta': {'_created': 'x', 'v': 1},
+    ...     'age': {'%allot': encrypt(sk, 30)}
+    ... })
+    >>> unify(sk, shares)
+    {'meta': {'v': 1}, 'age': 30}
+    >>> d = {'a': 1, '_created': 'x'}
+    >>> unify(sk, [d, d, d])
+    {'a': 1}
+
     Any attempt to supply incompatible document shares raises an exception.
 
     >>> unify(sk, [123, 'abc'])
@@ -1280,4 +1486,5 @@ def unify(
     raise TypeError('array of compatible document shares expected')
 
 if __name__ == '__main__':
+    import doctest # pragma: no cover
     doctest.testmod() # pragma: no cover
@@ -0,0 +1,122 @@
+"""
+Session-scoped fixtures that supply cryptographic keys shared across tests.
+"""
+import pytest
+
+import blindfold
+
+# Modify the Paillier secret key length to reduce running time of tests.
+blindfold.SecretKey._paillier_key_length = 256 # pylint: disable=protected-access
+
+CLUSTER_WITH_ONE_NODE = {'nodes': [{}]}
+"""
+Configuration for a cluster that has a single node.
+"""
+
+CLUSTER_WITH_TWO_NODES = {'nodes': [{}, {}]}
+"""
+Configuration for a cluster that has two nodes.
+"""
+
+CLUSTER_WITH_THREE_NODES = {'nodes': [{}, {}, {}]}
+"""
+Configuration for a cluster that has three nodes.
+"""
+
+OPERATIONS_FOR_STORE = {'store': True}
+"""
+Operations specification for the store operation.
+"""
+
+OPERATIONS_FOR_MATCH = {'match': True}
+"""
+Operations specification for the match operation.
+"""
+
+OPERATIONS_FOR_SUM = {'sum': True}
+"""
+Operations specification for the sum operation.
+"""
+
+@pytest.fixture(scope='session')
+def sk_store_1():
+    """
+    Secret key for the store operation for a single-node cluster.
+    """
+    return blindfold.SecretKey.generate(CLUSTER_WITH_ONE_NODE, OPERATIONS_FOR_STORE)
+
+@pytest.fixture(scope='session')
+def sk_store_3():
+    """
+    Secret key for the store operation for a three-node cluster.
+    """
+    return blindfold.SecretKey.generate(CLUSTER_WITH_THREE_NODES, OPERATIONS_FOR_STORE)
+
+@pytest.fixture(scope='session')
+def sk_match_1():
+    """
+    Secret key for the match operation for a single-node cluster.
+    """
+    return blindfold.SecretKey.generate(CLUSTER_WITH_ONE_NODE, OPERATIONS_FOR_MATCH)
+
+@pytest.fixture(scope='session')
+def sk_match_3():
+    """
+    Secret key for the match operation for a three-node cluster.
+    """
+    return blindfold.SecretKey.generate(CLUSTER_WITH_THREE_NODES, OPERATIONS_FOR_MATCH)
+
+@pytest.fixture(scope='session')
+def sk_sum_1():
+    """
+    Secret key for the sum operation for a single-node cluster.
+    """
+    return blindfold.SecretKey.generate(CLUSTER_WITH_ONE_NODE, OPERATIONS_FOR_SUM)
+
+@pytest.fixture(scope='session')
+def sk_sum_3():
+    """
+    Secret key for the sum operation for a three-node cluster.
+    """
+    return blindfold.SecretKey.generate(CLUSTER_WITH_THREE_NODES, OPERATIONS_FOR_SUM)
+
+@pytest.fixture(scope='session')
+def sk_sum_3_threshold_2():
+    """
+    Secret key for the sum operation for a three-node cluster with a threshold
+    of two.
+    """
+    return blindfold.SecretKey.generate(CLUSTER_WITH_THREE_NODES, OPERATIONS_FOR_SUM, threshold=2)
+
+@pytest.fixture(scope='session')
+def pk_sum_1(sk_sum_1): # pylint: disable=redefined-outer-name
+    """
+    Public key for the sum operation for a single-node cluster.
+    """
+    return blindfold.PublicKey.generate(sk_sum_1)
+
+@pytest.fixture
+def sk_store(request, cluster_size):
+    """
+    Secret key for the store operation for a cluster of the parametrized size.
+    """
+    return request.getfixturevalue(f'sk_store_{cluster_size}')
+
+@pytest.fixture
+def sk_match(request, cluster_size):
+    """
+    Secret key for the match operation for a cluster of the parametrized size.
+    """
+    return request.getfixturevalue(f'sk_match_{cluster_size}')
+
+@pytest.fixture
+def encryption_key(request, operation, cluster_size):
+    """
+    Key used to encrypt for the parametrized operation and cluster size (the
+    public key for the sum operation with a single-node cluster and the secret
+    key otherwise).
+    """
+    if operation == 'sum' and cluster_size == 1:
+        return request.getfixturevalue('pk_sum_1')
+
+    return request.getfixturevalue(f'sk_{operation}_{cluster_size}')
@@ -2,19 +2,18 @@
 Test suite containing functional unit tests of exported functions.
 """
 from typing import Union
-from unittest import TestCase
-from importlib import import_module
 import functools
+import re
 import json
 import base64
 import hashlib
 import pytest
+from conftest import \
+    CLUSTER_WITH_ONE_NODE, CLUSTER_WITH_TWO_NODES, CLUSTER_WITH_THREE_NODES, \
+    OPERATIONS_FOR_STORE, OPERATIONS_FOR_MATCH, OPERATIONS_FOR_SUM
 
 import blindfold
 
-# Modify the Paillier secret key length to reduce running time of tests.
-blindfold.SecretKey._paillier_key_length = 256 # pylint: disable=protected-access
-
 _SECRET_SHARED_SIGNED_INTEGER_MODULUS = (2 ** 32) + 15
 
 def _shamirs_add(shares1, shares2, prime=_SECRET_SHARED_SIGNED_INTEGER_MODULUS):
@@ -40,20 +39,49 @@ def to_hash_base64(output: Union[bytes, list[int]]) -> str:
 
     return base64.b64encode(hashlib.sha256(output).digest()).decode('ascii')
 
-SECRET_KEY_FOR_SUM_WITH_SINGLE_NODE = blindfold.SecretKey.generate(
-  {'nodes': [{}]},
-  {'sum': True}
-)
-"""
-Precomputed constant that can be reused to reduce running time of tests.
-"""
+_json_encode = json.JSONEncoder(separators=(',', ':')).encode
+_json_decode = json.JSONDecoder().decode
+
+def _roundtrip(cls, dictionary):
+    """
+    Helper function for converting a dumped key to JSON and back, and then
+    loading it as an instance of the supplied key class.
+    """
+    return cls.load(_json_decode(_json_encode(dictionary)))
 
 SEED = "012345678901234567890123456789012345678901234567890123456789"
 """
 Seed used for tests confirming that key generation from seeds is consistent.
 """
 
-class TestAPI(TestCase):
+CIPHERTEXT_FOR_STORE_WITH_THREE_NODES = ('Ifkz2Q==', '8nqHOQ==', '0uLWgw==')
+"""
+Ciphertext of the string ``'abc'`` for the store operation in a cluster that
+has three nodes.
+"""
+
+CIPHERTEXT_FOR_SUM_WITH_THREE_NODES = (456, 246, 4294967296 + 15 - 123 - 456)
+"""
+Ciphertext of the integer ``123`` for the sum operation in a cluster that has
+three nodes.
+"""
+
+# Patterns matching the messages of expected errors (compiled once and shared
+# by all tests).
+ERROR_CLUSTER_INVALID = re.compile('valid cluster configuration is required')
+ERROR_CLUSTER_EMPTY = re.compile('cluster configuration must contain at least one node')
+ERROR_OPERATIONS_INVALID = re.compile('valid operations specification is required')
+ERROR_OPERATIONS_NOT_ONE = re.compile('secret key must support exactly one operation')
+ERROR_PUBLIC_KEY_UNSUPPORTED = re.compile('cannot create public key for supplied secret key')
+ERROR_INTEGER_RANGE = re.compile('numeric plaintext must be a valid 32-bit signed integer')
+ERROR_STRING_LENGTH = re.compile('string or binary plaintext must be possible to encode in 4096 bytes or fewer')
+ERROR_SUM_PLAINTEXT_TYPE = re.compile('plaintext to encrypt for sum operation must be an integer')
+ERROR_CIPHERTEXT_SINGLE_NODE = re.compile('secret key requires a valid ciphertext from a single-node cluster')
+ERROR_CIPHERTEXT_MULTIPLE_NODES = re.compile('secret key requires a valid ciphertext from a multiple-node cluster')
+ERROR_CIPHERTEXT_SHARES = re.compile('ciphertext must have enough shares for cluster size or threshold')
+ERROR_DECRYPTION = re.compile('cannot decrypt the supplied ciphertext using the supplied key')
+
+class TestAPI:
     """
     Test that the exported classes and functions match the expected API.
     """
@@ -61,193 +89,173 @@ class TestAPI(TestCase):
         """
         Check that the module exports the expected classes and functions.
         """
-        module = import_module('blindfold.blindfold')
-        self.assertTrue({
+        assert {
             'SecretKey', 'ClusterKey', 'PublicKey',
             'encrypt', 'decrypt', 'allot', 'unify'
-        }.issubset(module.__dict__.keys()))
+        }.issubset(vars(blindfold.blindfold))
 
-class TestKeys(TestCase):
+class TestKeys:
     """
     Tests of methods of cryptographic key classes.
     """
-    def test_key_operations_for_store(self):
+    @pytest.mark.parametrize('cluster_size', [1, 3])
+    def test_key_operations_for_store(self, sk_store):
         """
-        Test key generate, dump, JSONify, and load for store operation.
+        Test key generate, dump, and load for store operation.
         """
-        for cluster in [{'nodes': [{}]}, {'nodes': [{}, {}, {}]}]:
-            sk = blindfold.SecretKey.generate(cluster, {'store': True})
-            sk_loaded = blindfold.SecretKey.load(sk.dump())
-            self.assertTrue(isinstance(sk, blindfold.SecretKey))
-            self.assertEqual(sk_loaded, sk)
-
-            sk_from_json = blindfold.SecretKey.load(
-                json.loads(json.dumps(sk.dump()))
-            )
-            self.assertEqual(sk_from_json, sk)
+        sk = sk_store
+        sk_loaded = blindfold.SecretKey.load(sk.dump())
+        assert isinstance(sk, blindfold.SecretKey)
+        assert sk_loaded == sk
 
-    def test_key_operations_for_match(self):
+    @pytest.mark.parametrize('cluster_size', [1, 3])
+    def test_key_operations_for_match(self, sk_match):
         """
-        Test key generate, dump, JSONify, and load for store operation.
+        Test key generate, dump, and load for store operation.
         """
-        for cluster in [{'nodes': [{}]}, {'nodes': [{}, {}, {}]}]:
-            sk = blindfold.SecretKey.generate(cluster, {'match': True})
-            sk_loaded = blindfold.SecretKey.load(sk.dump())
-            self.assertTrue(isinstance(sk, blindfold.SecretKey))
-            self.assertEqual(sk_loaded, sk)
-
-            sk_from_json = blindfold.SecretKey.load(
-                json.loads(json.dumps(sk.dump()))
-            )
-            self.assertEqual(sk_from_json, sk)
+        sk = sk_match
+        sk_loaded = blindfold.SecretKey.load(sk.dump())
+        assert isinstance(sk, blindfold.SecretKey)
+        assert sk_loaded == sk
 
-    def test_key_operations_for_sum_with_single_node(self):
+    def test_key_operations_for_sum_with_single_node(self, sk_sum_1, pk_sum_1):
         """
-        Test key generate, dump, JSONify, and load for store operation
+        Test key generate, dump, and load for store operation
         with a single node.
         """
-        sk = blindfold.SecretKey.generate({'nodes': [{}]}, {'sum': True})
+        sk = sk_sum_1
         sk_loaded = blindfold.SecretKey.load(sk.dump())
-        self.assertTrue(isinstance(sk, blindfold.SecretKey))
-        self.assertEqual(sk_loaded, sk)
-
-        sk_from_json = blindfold.SecretKey.load(
-            json.loads(json.dumps(sk.dump()))
-        )
-        self.assertEqual(sk_from_json, sk)
+        assert isinstance(sk, blindfold.SecretKey)
+        assert sk_loaded == sk
 
-        pk = blindfold.PublicKey.generate(sk)
+        pk = pk_sum_1
         pk_loaded = blindfold.PublicKey.load(pk.dump())
-        self.assertTrue(isinstance(pk, blindfold.PublicKey))
-        self.assertEqual(pk_loaded, pk)
-
-        pk_from_json = blindfold.PublicKey.load(
-            json.loads(json.dumps(pk.dump()))
-        )
-        self.assertEqual(pk_from_json, pk)
+        assert isinstance(pk, blindfold.PublicKey)
+        assert pk_loaded == pk
 
-    def test_key_operations_for_sum_with_multiple_nodes(self):
+    def test_key_operations_for_sum_with_multiple_nodes(self, sk_sum_3):
         """
-        Test key generate, dump, JSONify, and load for sum operation
+        Test key generate, dump, and load for sum operation
         with multiple nodes.
         """
-        sk = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'sum': True})
+        sk = sk_sum_3
         sk_loaded = blindfold.SecretKey.load(sk.dump())
-        self.assertTrue(isinstance(sk, blindfold.SecretKey))
-        self.assertEqual(sk_loaded, sk)
-
-        sk_from_json = blindfold.SecretKey.load(
-            json.loads(json.dumps(sk.dump()))
-        )
-        self.assertEqual(sk_from_json, sk)
+        assert isinstance(sk, blindfold.SecretKey)
+        assert sk_loaded == sk
 
-    def test_key_operations_for_sum_with_multiple_nodes_and_threshold(self):
+    def test_key_operations_for_sum_with_multiple_nodes_and_threshold(self, sk_sum_3_threshold_2):
         """
-        Test key generate, dump, JSONify, and load for sum operation
+        Test key generate, dump, and load for sum operation
         with multiple nodes and threshold.
         """
-        sk = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'sum': True}, threshold=2)
+        sk = sk_sum_3_threshold_2
         sk_loaded = blindfold.SecretKey.load(sk.dump())
-        self.assertTrue(isinstance(sk, blindfold.SecretKey))
-        self.assertEqual(sk_loaded, sk)
+        assert isinstance(sk, blindfold.SecretKey)
+        assert sk_loaded == sk
 
-        sk_from_json = blindfold.SecretKey.load(
-            json.loads(json.dumps(sk.dump()))
-        )
-        self.assertEqual(sk_from_json, sk)
-
-    def test_key_from_seed_for_store_with_single_node(self):
+    def test_key_from_seed_for_store_with_single_node(self, sk_store_1):
         """
         Test key generation from seed for store operation with a single node.
         """
-        sk_from_seed = blindfold.SecretKey.generate({'nodes': [{}]}, {'store': True}, seed=SEED)
-        self.assertEqual(
-            to_hash_base64(sk_from_seed['material']),
+        sk_from_seed = blindfold.SecretKey.generate(CLUSTER_WITH_ONE_NODE, OPERATIONS_FOR_STORE, seed=SEED)
+        assert (
+            to_hash_base64(sk_from_seed['material']) ==
             '2bW6BLeeCTqsCqrijSkBBPGjDb/gzjtGnFZt0nsZP8w='
         )
-        sk = blindfold.SecretKey.generate({'nodes': [{}]}, {'store': True})
-        self.assertNotEqual(
-            to_hash_base64(sk['material']),
+        assert (
+            to_hash_base64(sk_store_1['material']) !=
             '2bW6BLeeCTqsCqrijSkBBPGjDb/gzjtGnFZt0nsZP8w='
         )
 
-    def test_key_from_seed_for_store_with_multiple_nodes(self):
+    def test_key_from_seed_for_store_with_multiple_nodes(self, sk_store_3):
         """
         Test key generation from seed for store operation with multiple nodes.
         """
-        sk_from_seed = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'store': True}, seed=SEED)
-        self.assertEqual(
-            to_hash_base64(sk_from_seed['material']),
+        sk_from_seed = blindfold.SecretKey.generate(CLUSTER_WITH_THREE_NODES, OPERATIONS_FOR_STORE, seed=SEED)
+        assert (
+            to_hash_base64(sk_from_seed['material']) ==
             '2bW6BLeeCTqsCqrijSkBBPGjDb/gzjtGnFZt0nsZP8w='
         )
-        sk = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'store': True})
-        self.assertNotEqual(
-            to_hash_base64(sk['material']),
+        assert (
+            to_hash_base64(sk_store_3['material']) !=
             '2bW6BLeeCTqsCqrijSkBBPGjDb/gzjtGnFZt0nsZP8w='
         )
 
-    def test_key_from_seed_for_match_with_single_node(self):
+    def test_key_from_seed_for_match_with_single_node(self, sk_match_1):
         """
         Test key generation from seed for match operation with a single node.
         """
-        sk_from_seed = blindfold.SecretKey.generate({'nodes': [{}]}, {'match': True}, seed=SEED)
-        self.assertEqual(
-            to_hash_base64(sk_from_seed['material']),
+        sk_from_seed = blindfold.SecretKey.generate(CLUSTER_WITH_ONE_NODE, OPERATIONS_FOR_MATCH, seed=SEED)
+        assert (
+            to_hash_base64(sk_from_seed['material']) ==
             'qbcFGTOGTPo+vs3EChnVUWk5lnn6L6Cr/DIq8li4H+4='
         )
-        sk = blindfold.SecretKey.generate({'nodes': [{}]}, {'match': True})
-        self.assertNotEqual(
-            to_hash_base64(sk['material']),
+        assert (
+            to_hash_base64(sk_match_1['material']) !=
             'qbcFGTOGTPo+vs3EChnVUWk5lnn6L6Cr/DIq8li4H+4='
         )
 
-    def test_key_from_seed_for_match_with_multiple_nodes(self):
+    def test_key_from_seed_for_match_with_multiple_nodes(self, sk_match_3):
         """
         Test key generation from seed for match operation with a single node.
         """
-        sk_from_seed = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'match': True}, seed=SEED)
-        self.assertEqual(
-            to_hash_base64(sk_from_seed['material']),
+        sk_from_seed = blindfold.SecretKey.generate(CLUSTER_WITH_THREE_NODES, OPERATIONS_FOR_MATCH, seed=SEED)
+        assert (
+            to_hash_base64(sk_from_seed['material']) ==
             'qbcFGTOGTPo+vs3EChnVUWk5lnn6L6Cr/DIq8li4H+4='
         )
-        sk = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'match': True})
-        self.assertNotEqual(
-            to_hash_base64(sk['material']),
+        assert (
+            to_hash_base64(sk_match_3['material']) !=
             'qbcFGTOGTPo+vs3EChnVUWk5lnn6L6Cr/DIq8li4H+4='
         )
 
-    def test_key_from_seed_for_sum_with_multiple_nodes(self):
+    def test_key_from_seed_for_sum_with_multiple_nodes(self, sk_sum_3):
         """
         Test key generation from seed for sum operation with multiple nodes.
         """
-        sk_from_seed = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'sum': True}, seed=SEED)
-        self.assertEqual(
-            to_hash_base64(sk_from_seed['material']),
+        sk_from_seed = blindfold.SecretKey.generate(CLUSTER_WITH_THREE_NODES, OPERATIONS_FOR_SUM, seed=SEED)
+        assert (
+            to_hash_base64(sk_from_seed['material']) ==
             'L8RiHNq2EUgt/fDOoUw9QK2NISeUkAkhxHHIPoHPZ84='
         )
-        sk = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'sum': True})
-        self.assertNotEqual(
-            to_hash_base64(sk['material']),
+        assert (
+            to_hash_base64(sk_sum_3['material']) !=
             'L8RiHNq2EUgt/fDOoUw9QK2NISeUkAkhxHHIPoHPZ84='
         )
 
-    def test_key_from_seed_for_sum_with_multiple_nodes_and_threshold(self):
+    def test_key_from_seed_for_sum_with_multiple_nodes_and_threshold(self, sk_sum_3_threshold_2):
         """
         Test key generation from seed for sum operation with multiple nodes
         and a threshold.
         """
-        sk_from_seed = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'sum': True}, threshold=2, seed=SEED)
-        self.assertEqual(
-            to_hash_base64(sk_from_seed['material']),
+        sk_from_seed = blindfold.SecretKey.generate(
+            CLUSTER_WITH_THREE_NODES, OPERATIONS_FOR_SUM, threshold=2, seed=SEED
+        )
+        assert (
+            to_hash_base64(sk_from_seed['material']) ==
             'L8RiHNq2EUgt/fDOoUw9QK2NISeUkAkhxHHIPoHPZ84='
         )
-        sk = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'sum': True}, threshold=2)
-        self.assertNotEqual(
-            to_hash_base64(sk['material']),
+        assert (
+            to_hash_base64(sk_sum_3_threshold_2['material']) !=
             'L8RiHNq2EUgt/fDOoUw9QK2NISeUkAkhxHHIPoHPZ84='
         )
 
-class TestKeysError(TestCase):
+    @pytest.mark.parametrize(
+        'key',
+        [
+            'sk_store_1', 'sk_store_3', 'sk_match_1', 'sk_match_3',
+            'sk_sum_1', 'pk_sum_1', 'sk_sum_3', 'sk_sum_3_threshold_2'
+        ]
+    )
+    def test_key_dump_json_serialization(self, request, key):
+        """
+        Test that every kind of key can be dumped, converted to JSON and back,
+        and then loaded.
+        """
+        key = request.getfixturevalue(key)
+        assert _roundtrip(type(key), key.dump()) == key
+
+class TestKeysError:
     """
     Tests of errors thrown by methods of cryptographic key classes.
     """
@@ -257,117 +265,108 @@ class TestKeysError(TestCase):
         """
         with pytest.raises(
             ValueError,
-            match='valid cluster configuration is required'
+            match=ERROR_CLUSTER_INVALID
         ):
-            blindfold.SecretKey.generate(123, {'store': True})
+            blindfold.SecretKey.generate(123, OPERATIONS_FOR_STORE)
 
         with pytest.raises(
             ValueError,
-            match='cluster configuration must contain at least one node'
+            match=ERROR_CLUSTER_EMPTY
         ):
-            blindfold.SecretKey.generate({'nodes': []}, {'store': True})
+            blindfold.SecretKey.generate({'nodes': []}, OPERATIONS_FOR_STORE)
 
         with pytest.raises(
             ValueError,
-            match='valid operations specification is required'
+            match=ERROR_OPERATIONS_INVALID
         ):
-            blindfold.SecretKey.generate({'nodes': [{}]}, 123)
+            blindfold.SecretKey.generate(CLUSTER_WITH_ONE_NODE, 123)
 
         with pytest.raises(
             ValueError,
-            match='secret key must support exactly one operation'
+            match=ERROR_OPERATIONS_NOT_ONE
         ):
-            blindfold.SecretKey.generate({'nodes': [{}]}, {})
+            blindfold.SecretKey.generate(CLUSTER_WITH_ONE_NODE, {})
 
-    def test_public_key_generation_errors(self):
+    def test_public_key_generation_errors(self, sk_sum_3):
         """
         Test errors in public key generation.
         """
+        sk = sk_sum_3
         with pytest.raises(
             ValueError,
-            match='cannot create public key for supplied secret key'
+            match=ERROR_PUBLIC_KEY_UNSUPPORTED
         ):
-            sk = blindfold.SecretKey.generate({'nodes':[{}, {}]}, {'sum': True})
             blindfold.PublicKey.generate(sk)
 
-class TestFunctions(TestCase):
+class TestFunctions:
     """
     Tests of the functional and algebraic properties of encryption/decryption functions.
     """
-    def test_encrypt_decrypt_for_store(self):
+    @pytest.mark.parametrize('cluster_size', [1, 3])
+    @pytest.mark.parametrize('plaintext', [123, 'abc'])
+    def test_encrypt_decrypt_for_store(self, sk_store, plaintext):
         """
         Test encryption and decryption for storing.
         """
-        for cluster in [{'nodes': [{}]}, {'nodes': [{}, {}, {}]}]:
-            sk = blindfold.SecretKey.generate(cluster, {'store': True})
-
-            plaintext = 123
-            decrypted = blindfold.decrypt(sk, blindfold.encrypt(sk, plaintext))
-            self.assertEqual(decrypted, plaintext)
-
-            plaintext = 'abc'
-            decrypted = blindfold.decrypt(sk, blindfold.encrypt(sk, plaintext))
-            self.assertEqual(decrypted, plaintext)
+        sk = sk_store
+        decrypted = blindfold.decrypt(sk, blindfold.encrypt(sk, plaintext))
+        assert decrypted == plaintext
 
-    def test_encrypt_for_match(self):
+    @pytest.mark.parametrize('cluster_size', [1, 3])
+    @pytest.mark.parametrize(
+        'plaintext_one, plaintext_two, equal',
+        [(123, 123, True), ('abc', 'abc', True), ('abc', 'ABC', False)]
+    )
+    def test_encrypt_for_match(self, sk_match, plaintext_one, plaintext_two, equal):
         """
         Test encryption for matching.
         """
-        for cluster in [{'nodes': [{}]}, {'nodes': [{}, {}, {}]}]:
-            sk = blindfold.SecretKey.generate(cluster, {'match': True})
-            ciphertext_one = blindfold.encrypt(sk, 123)
-            ciphertext_two = blindfold.encrypt(sk, 123)
-            ciphertext_three = blindfold.encrypt(sk, 'abc')
-            ciphertext_four = blindfold.encrypt(sk, 'abc')
-            ciphertext_five = blindfold.encrypt(sk, 'ABC')
-            self.assertEqual(ciphertext_one, ciphertext_two)
-            self.assertEqual(ciphertext_three, ciphertext_four)
-            self.assertNotEqual(ciphertext_four, ciphertext_five)
+        sk = sk_match
+        ciphertext_one = blindfold.encrypt(sk, plaintext_one)
+        ciphertext_two = blindfold.encrypt(sk, plaintext_two)
+        assert (ciphertext_one == ciphertext_two) == equal
 
-    def test_encrypt_decrypt_of_int_for_sum_single(self):
+    def test_encrypt_decrypt_of_int_for_sum_single(self, sk_sum_1, pk_sum_1):
         """
         Test encryption and decryption for sum operation with a single node.
         """
-        sk = SECRET_KEY_FOR_SUM_WITH_SINGLE_NODE
-        pk = blindfold.PublicKey.generate(sk)
         plaintext = 123
-        ciphertext = blindfold.encrypt(pk, plaintext)
-        decrypted = blindfold.decrypt(sk, ciphertext)
-        self.assertEqual(decrypted, plaintext)
+        ciphertext = blindfold.encrypt(pk_sum_1, plaintext)
+        decrypted = blindfold.decrypt(sk_sum_1, ciphertext)
+        assert decrypted == plaintext
 
-    def test_encrypt_decrypt_of_int_for_sum_multiple(self):
+    def test_encrypt_decrypt_of_int_for_sum_multiple(self, sk_sum_3):
         """
         Test encryption and decryption for sum operation with multiple nodes.
         """
-        sk = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'sum': True})
         plaintext = 123
-        ciphertext = blindfold.encrypt(sk, plaintext)
-        decrypted = blindfold.decrypt(sk, ciphertext)
-        self.assertEqual(decrypted, plaintext)
+        ciphertext = blindfold.encrypt(sk_sum_3, plaintext)
+        decrypted = blindfold.decrypt(sk_sum_3, ciphertext)
+        assert decrypted == plaintext
 
-    def test_encrypt_decrypt_of_int_for_sum_multiple_with_threshold(self):
+    def test_encrypt_decrypt_of_int_for_sum_multiple_with_threshold(self, sk_sum_3_threshold_2):
         """
         Test encryption and decryption for sum operation with multiple nodes
         and a threshold.
         """
-        sk = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'sum': True})
+        sk = sk_sum_3_threshold_2
         plaintext = 123
         ciphertext = blindfold.encrypt(sk, plaintext)
         decrypted = blindfold.decrypt(sk, ciphertext)
-        self.assertEqual(decrypted, plaintext)
+        assert decrypted == plaintext
 
-    def test_encrypt_decrypt_of_int_for_sum_with_one_failure_multiple_with_threshold(self):
+    def test_encrypt_decrypt_of_int_for_sum_with_one_failure_multiple_with_threshold(self, sk_sum_3_threshold_2):
         """
         Test encryption and decryption for sum operation with multiple nodes
         and a threshold.
         """
-        sk = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'sum': True}, threshold=2)
+        sk = sk_sum_3_threshold_2
         plaintext = 123
         ciphertext = blindfold.encrypt(sk, plaintext)
         decrypted = blindfold.decrypt(sk, ciphertext[1:])
-        self.assertEqual(decrypted, plaintext)
+        assert decrypted == plaintext
 
-class TestCiphertextRepresentations(TestCase):
+class TestCiphertextRepresentations:
     """
     Tests of the portable representation of ciphertexts.
     """
@@ -375,170 +374,109 @@ class TestCiphertextRepresentations(TestCase):
         """
         Test that ciphertext representation when storing in a multiple-node cluster.
         """
-        cluster = {'nodes': [{}, {}, {}]}
-        operations = {'store': True}
-        ck = blindfold.ClusterKey.generate(cluster, operations)
+        ck = blindfold.ClusterKey.generate(CLUSTER_WITH_THREE_NODES, OPERATIONS_FOR_STORE)
         plaintext = 'abc'
-        ciphertext = ['Ifkz2Q==', '8nqHOQ==', '0uLWgw==']
-        decrypted = blindfold.decrypt(ck, ciphertext)
-        self.assertEqual(decrypted, plaintext)
+        decrypted = blindfold.decrypt(ck, CIPHERTEXT_FOR_STORE_WITH_THREE_NODES)
+        assert decrypted == plaintext
 
     def test_ciphertext_representation_for_sum_with_multiple_nodes(self):
         """
         Test that ciphertext representation when storing in a multiple-node cluster.
         """
-        cluster = {'nodes': [{}, {}, {}]}
-        operations = {'sum': True}
-        ck = blindfold.ClusterKey.generate(cluster, operations)
+        ck = blindfold.ClusterKey.generate(CLUSTER_WITH_THREE_NODES, OPERATIONS_FOR_SUM)
         plaintext = 123
-        ciphertext = [456, 246, 4294967296 + 15 - 123 - 456]
-        decrypted = blindfold.decrypt(ck, ciphertext)
-        self.assertEqual(decrypted, plaintext)
+        decrypted = blindfold.decrypt(ck, CIPHERTEXT_FOR_SUM_WITH_THREE_NODES)
+        assert decrypted == plaintext
 
     def test_ciphertext_representation_for_sum_with_multiple_nodes_and_threshold(self):
         """
         Test that ciphertext representation when storing in a multiple-node cluster.
         """
-        cluster = {'nodes': [{}, {}, {}]}
-        operations = {'sum': True}
-        ck = blindfold.ClusterKey.generate(cluster, operations, threshold=2)
+        ck = blindfold.ClusterKey.generate(CLUSTER_WITH_THREE_NODES, OPERATIONS_FOR_SUM, threshold=2)
         plaintext = 123
         ciphertext = [[1, 1382717699], [2, 2765435275], [3, 4148152851]]
         decrypted = blindfold.decrypt(ck, ciphertext)
-        self.assertEqual(decrypted, plaintext)
+        assert decrypted == plaintext
 
-class TestFunctionsErrors(TestCase):
+class TestFunctionsErrors:
     """
     Tests verifying that encryption/decryption methods return expected errors.
     """
-    def test_encrypt_of_int_for_store_error(self):
-        """
-        Test range error during encryption of integer for matching.
-        """
-        with pytest.raises(
-            ValueError,
-            match='numeric plaintext must be a valid 32-bit signed integer'
-        ):
-            cluster = {'nodes': [{}]}
-            operations = {'store': True}
-            sk = blindfold.SecretKey.generate(cluster, operations)
-            plaintext = 2 ** 32
-            blindfold.encrypt(sk, plaintext)
-
-    def test_encrypt_of_str_for_store_error(self):
-        """
-        Test range error during encryption of string for matching.
-        """
-        with pytest.raises(
-            ValueError,
-            match='string or binary plaintext must be possible to encode in 4096 bytes or fewer'
-        ):
-            cluster = {'nodes': [{}]}
-            operations = {'store': True}
-            sk = blindfold.SecretKey.generate(cluster, operations)
-            plaintext = 'X' * 4097
-            blindfold.encrypt(sk, plaintext)
-
-    def test_encrypt_of_int_for_match_error(self):
-        """
-        Test range error during encryption of integer for matching.
-        """
-        with pytest.raises(
-            ValueError,
-            match='numeric plaintext must be a valid 32-bit signed integer'
-        ):
-            cluster = {'nodes': [{}]}
-            operations = {'match': True}
-            sk = blindfold.SecretKey.generate(cluster, operations)
-            plaintext = 2 ** 32
-            blindfold.encrypt(sk, plaintext)
-
-    def test_encrypt_of_str_for_match_error(self):
-        """
-        Test range error during encryption of string for matching.
-        """
-        with pytest.raises(
-            ValueError,
-            match='string or binary plaintext must be possible to encode in 4096 bytes or fewer'
-        ):
-            cluster = {'nodes': [{}]}
-            operations = {'match': True}
-            sk = blindfold.SecretKey.generate(cluster, operations)
-            plaintext = 'X' * 4097
-            blindfold.encrypt(sk, plaintext)
-
-    def test_encrypt_of_int_for_sum_error(self):
-        """
-        Test range error during encryption of integer for matching.
-        """
-        for cluster in [{'nodes': [{}]}, {'nodes': [{}, {}, {}]}]:
-            with pytest.raises(
-                TypeError,
-                match='plaintext to encrypt for sum operation must be an integer'
-            ):
-                sk = blindfold.SecretKey.generate(cluster, {'sum': True})
-                ek = blindfold.PublicKey.generate(sk) if len(cluster['nodes']) == 1 else sk
-                blindfold.encrypt(ek, 'abc')
-
-            with pytest.raises(
-                ValueError,
-                match='numeric plaintext must be a valid 32-bit signed integer'
-            ):
-                sk = blindfold.SecretKey.generate(cluster, {'sum': True})
-                ek = blindfold.PublicKey.generate(sk) if len(cluster['nodes']) == 1 else sk
-                blindfold.encrypt(ek, 2 ** 32)
-
-    def test_decrypt_for_store_cluster_size_mismatch_error(self):
+    @pytest.mark.parametrize(
+        'operation, cluster_size, plaintext, error, message',
+        [
+            ('store', 1, 2 ** 32, ValueError, ERROR_INTEGER_RANGE),
+            ('store', 1, 'X' * 4097, ValueError, ERROR_STRING_LENGTH),
+            ('match', 1, 2 ** 32, ValueError, ERROR_INTEGER_RANGE),
+            ('match', 1, 'X' * 4097, ValueError, ERROR_STRING_LENGTH),
+            ('sum', 1, 2 ** 32, ValueError, ERROR_INTEGER_RANGE),
+            ('sum', 1, 'abc', TypeError, ERROR_SUM_PLAINTEXT_TYPE),
+            ('sum', 3, 2 ** 32, ValueError, ERROR_INTEGER_RANGE),
+            ('sum', 3, 'abc', TypeError, ERROR_SUM_PLAINTEXT_TYPE)
+        ],
+        ids=[
+            'store-1-int', 'store-1-str', 'match-1-int', 'match-1-str',
+            'sum-1-int', 'sum-1-str', 'sum-3-int', 'sum-3-str'
+        ]
+    )
+    def test_encrypt_error(self, encryption_key, plaintext, error, message):
+        """
+        Test type and range errors during encryption for each operation.
+        """
+        with pytest.raises(error, match=message):
+            blindfold.encrypt(encryption_key, plaintext)
+
+    def test_decrypt_for_store_cluster_size_mismatch_error(self, sk_store_1, sk_store_3):
         """
         Test errors in decryption for store operation due to cluster size mismatch.
         """
-        sk_one = blindfold.SecretKey.generate({'nodes': [{}]}, {'store': True})
-        sk_two = blindfold.SecretKey.generate({'nodes': [{}, {}]}, {'store': True})
-        sk_three = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'store': True})
+        sk_one = sk_store_1
+        sk_two = blindfold.SecretKey.generate(CLUSTER_WITH_TWO_NODES, OPERATIONS_FOR_STORE)
+        sk_three = sk_store_3
         ciphertext_one = blindfold.encrypt(sk_one, 123)
         ciphertext_two = blindfold.encrypt(sk_two, 123)
 
         with pytest.raises(
             ValueError,
-            match='secret key requires a valid ciphertext from a single-node cluster'
+            match=ERROR_CIPHERTEXT_SINGLE_NODE
         ):
             blindfold.decrypt(sk_one, ciphertext_two)
 
         with pytest.raises(
             ValueError,
-            match='secret key requires a valid ciphertext from a multiple-node cluster'
+            match=ERROR_CIPHERTEXT_MULTIPLE_NODES
         ):
             blindfold.decrypt(sk_two, ciphertext_one)
 
         with pytest.raises(
             ValueError,
-            match='ciphertext must have enough shares for cluster size or threshold'
+            match=ERROR_CIPHERTEXT_SHARES
         ):
             blindfold.decrypt(sk_three, ciphertext_two)
 
-    def test_decrypt_for_store_key_mismatch_error(self):
+    def test_decrypt_for_store_key_mismatch_error(self, sk_store_1):
         """
         Test errors in decryption for store operation due to key mismatch.
         """
+        sk = sk_store_1
+        sk_alt = blindfold.SecretKey.generate(CLUSTER_WITH_ONE_NODE, OPERATIONS_FOR_STORE)
+        plaintext = 123
+        ciphertext = blindfold.encrypt(sk, plaintext)
         with pytest.raises(
             ValueError,
-            match='cannot decrypt the supplied ciphertext using the supplied key'
+            match=ERROR_DECRYPTION
         ):
-            sk = blindfold.SecretKey.generate({'nodes': [{}]}, {'store': True})
-            sk_alt = blindfold.SecretKey.generate({'nodes': [{}]}, {'store': True})
-            plaintext = 123
-            ciphertext = blindfold.encrypt(sk, plaintext)
             blindfold.decrypt(sk_alt, ciphertext)
 
-class TestSecureComputations(TestCase):
+class TestSecureComputations:
     """
     Tests consisting of end-to-end workflows involving secure computation.
     """
-    def test_workflow_for_secure_sum_with_multiple_nodes(self):
+    def test_workflow_for_secure_sum_with_multiple_nodes(self, sk_sum_3):
         """
         Test secure summation workflow for a cluster that has multiple nodes.
         """
-        sk = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'sum': True})
+        sk = sk_sum_3
         (a0, b0, c0) = blindfold.encrypt(sk, 123)
         (a1, b1, c1) = blindfold.encrypt(sk, 456)
         (a2, b2, c2) = blindfold.encrypt(sk, 789)
@@ -548,14 +486,14 @@ class TestSecureComputations(TestCase):
             (c0 + c1 + c2) % (2 ** 32 + 15)
         )
         decrypted = blindfold.decrypt(sk, [a3, b3, c3])
-        self.assertEqual(decrypted, 123 + 456 + 789)
+        assert decrypted == 123 + 456 + 789
 
-    def test_workflow_for_secure_sum_with_multiple_nodes_and_threshold(self):
+    def test_workflow_for_secure_sum_with_multiple_nodes_and_threshold(self, sk_sum_3_threshold_2):
         """
         Test secure summation workflow with a threshold for a cluster that has
         multiple nodes.
         """
-        sk = blindfold.SecretKey.generate({'nodes': [{}, {}, {}]}, {'sum': True}, threshold=2)
+        sk = sk_sum_3_threshold_2
         (a0, b0, c0) = blindfold.encrypt(sk, 123)
         (a1, b1, c1) = blindfold.encrypt(sk, 456)
         (a2, b2, c2) = blindfold.encrypt(sk, 789)
@@ -564,4 +502,4 @@ class TestSecureComputations(TestCase):
             [a2, b2, c2]
         )
         decrypted = blindfold.decrypt(sk, [a3, b3, c3])
-        self.assertEqual(decrypted, 123 + 456 + 789)
+        assert decrypted == 123 + 456 + 789
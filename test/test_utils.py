@@ -1,5 +1,4 @@
 import json
-from unittest import TestCase
 
 import blindfold
 
@@ -20,7 +19,7 @@ with open("test/testdata/plaintext.json", "r") as f:
     plaintext_record = json.load(f)
 
 
-class TestUtils(TestCase):
+class TestUtils:
     """
     Test that the allot and unify functions complete as expected.
     """
@@ -30,7 +29,7 @@ class TestUtils(TestCase):
         Check that the module properly restructures the inputs
         """
         allot_split_for_N_nodes = blindfold.allot(cluster_encrypted_data)
-        self.assertEqual(allot_split_for_N_nodes, expected_allot_split)
+        assert allot_split_for_N_nodes == expected_allot_split
 
     def test_unify(self):
         """
@@ -41,4 +40,4 @@ class TestUtils(TestCase):
             shares_from_nildb["85ce66f5-9049-47cc-a81b-403cd6b49227"],
         )
 
-        self.assertEqual(decrypted, plaintext_record)
+        assert decrypted == plaintext_record